@@ -0,0 +1,36 @@
+"""Index revoked_tokens.expires_at for expiry sweeps
+
+Revision ID: a7c4e2f9d8b1
+Revises: f5a9c3d1b2e4
+Create Date: 2026-10-15 09:30:00.000000
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'a7c4e2f9d8b1'
+down_revision = 'f5a9c3d1b2e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name == 'postgresql':
+        # Build concurrently so logout inserts are not blocked while the index is created
+        with op.get_context().autocommit_block():
+            op.create_index(
+                op.f('ix_revoked_tokens_expires_at'), 'revoked_tokens', ['expires_at'],
+                unique=False, postgresql_concurrently=True, if_not_exists=True,
+            )
+    else:
+        op.create_index(op.f('ix_revoked_tokens_expires_at'), 'revoked_tokens', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                op.f('ix_revoked_tokens_expires_at'), table_name='revoked_tokens',
+                postgresql_concurrently=True, if_exists=True,
+            )
+    else:
+        op.drop_index(op.f('ix_revoked_tokens_expires_at'), table_name='revoked_tokens')
@@ -0,0 +1,39 @@
+"""Index user_id foreign keys on service_configs and config_versions
+
+Revision ID: b3d8f1a6c5e2
+Revises: a7c4e2f9d8b1
+Create Date: 2026-10-15 10:00:00.000000
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'b3d8f1a6c5e2'
+down_revision = 'a7c4e2f9d8b1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The existing composite indexes lead with name/service_name, so per-user
+    # listings (filtered on user_id alone) cannot use them.
+    if op.get_context().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index(op.f('ix_service_configs_user_id'), 'service_configs', ['user_id'],
+                            unique=False, postgresql_concurrently=True, if_not_exists=True)
+            op.create_index(op.f('ix_config_versions_user_id'), 'config_versions', ['user_id'],
+                            unique=False, postgresql_concurrently=True, if_not_exists=True)
+    else:
+        op.create_index(op.f('ix_service_configs_user_id'), 'service_configs', ['user_id'], unique=False)
+        op.create_index(op.f('ix_config_versions_user_id'), 'config_versions', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.drop_index(op.f('ix_config_versions_user_id'), table_name='config_versions',
+                          postgresql_concurrently=True, if_exists=True)
+            op.drop_index(op.f('ix_service_configs_user_id'), table_name='service_configs',
+                          postgresql_concurrently=True, if_exists=True)
+    else:
+        op.drop_index(op.f('ix_config_versions_user_id'), table_name='config_versions')
+        op.drop_index(op.f('ix_service_configs_user_id'), table_name='service_configs')
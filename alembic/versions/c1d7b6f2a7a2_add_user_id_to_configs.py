@@ -24,9 +24,17 @@ def upgrade() -> None:
     # 2) If there are existing users, choose a default owner; otherwise leave NULL.
     #    We avoid forcing NOT NULL until we can backfill in a safe manner.
 
-    # 3) Create an index on (name, user_id) and (service_name, user_id)
-    op.create_index(op.f('ix_service_configs_name_user_id'), 'service_configs', ['name', 'user_id'], unique=False)
-    op.create_index(op.f('ix_config_versions_service_user'), 'config_versions', ['service_name', 'user_id'], unique=False)
+    # 3) Create an index on (name, user_id) and (service_name, user_id).
+    #    On Postgres build them CONCURRENTLY so writers are not blocked during deploy.
+    if op.get_context().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index(op.f('ix_service_configs_name_user_id'), 'service_configs', ['name', 'user_id'],
+                            unique=False, postgresql_concurrently=True, if_not_exists=True)
+            op.create_index(op.f('ix_config_versions_service_user'), 'config_versions', ['service_name', 'user_id'],
+                            unique=False, postgresql_concurrently=True, if_not_exists=True)
+    else:
+        op.create_index(op.f('ix_service_configs_name_user_id'), 'service_configs', ['name', 'user_id'], unique=False)
+        op.create_index(op.f('ix_config_versions_service_user'), 'config_versions', ['service_name', 'user_id'], unique=False)
 
     # 4) Create a foreign key constraint if users table exists.
     try:
@@ -17,7 +17,13 @@ depends_on = None
 def upgrade() -> None:
     # add role column with default 'user'
     op.add_column('users', sa.Column('role', sa.String(), nullable=False, server_default='user'))
-    op.create_index(op.f('ix_users_role'), 'users', ['role'], unique=False)
+    if op.get_context().dialect.name == 'postgresql':
+        # build the index without blocking writes to users
+        with op.get_context().autocommit_block():
+            op.create_index(op.f('ix_users_role'), 'users', ['role'], unique=False,
+                            postgresql_concurrently=True, if_not_exists=True)
+    else:
+        op.create_index(op.f('ix_users_role'), 'users', ['role'], unique=False)
 
 
 def downgrade() -> None:
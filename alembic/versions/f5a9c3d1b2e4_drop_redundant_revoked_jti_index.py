@@ -0,0 +1,23 @@
+"""Drop redundant unique index on revoked_tokens.jti
+
+Revision ID: f5a9c3d1b2e4
+Revises: e3b1f7_add_revoked_tokens
+Create Date: 2026-10-15 09:00:00.000000
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'f5a9c3d1b2e4'
+down_revision = 'e3b1f7_add_revoked_tokens'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # jti is the primary key, which already carries a unique index; the extra
+    # ix_revoked_tokens_jti only doubles the index maintenance on every logout.
+    op.drop_index(op.f('ix_revoked_tokens_jti'), table_name='revoked_tokens', if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_revoked_tokens_jti'), 'revoked_tokens', ['jti'], unique=True)
@@ -1,46 +1,61 @@
-from datetime import timedelta
+from datetime import timedelta, datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import insert
 from sqlalchemy.orm.session import Session
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi import Security
 
-from app.core.security import get_password_hash, verify_password, create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES, decode_access_token, oauth2_scheme
+from app.core.revocation import mark_revoked
+from app.core.user_cache import get_user_by_username, invalidate_user
+from app.core.security import get_password_hash, verify_password, verify_dummy_password, create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES, decode_access_token, oauth2_scheme
 from app.db.database import get_db
 from app.schemas.user import UserCreate, UserResponse
 from app.db.models import User, RevokedToken
 from app.tasks.logger import (
     user_login_log, user_logout_log, user_registration_log,
-    user_login_log_sync, user_logout_log_sync, user_registration_log_sync
+    user_login_log_sync, user_logout_log_sync, user_registration_log_sync,
+    enqueue_log_fallback
 )
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 @router.post("/register", response_model=UserResponse)
 def register(user: UserCreate, db: Session = Depends(get_db)):
-    existing_user = db.query(User).filter_by(username=user.username).first()
+    existing_user = get_user_by_username(db, user.username)
     if existing_user:
         raise HTTPException(status_code=400, detail="Username already exists")
 
     hashed_pw = get_password_hash(user.password)
-    # default role handled by DB default if not provided
-    new_user = User(username=user.username, email=user.email, role=user.role, hashed_password=hashed_pw)
-    db.add(new_user)
+    values = {"username": user.username, "email": user.email, "hashed_password": hashed_pw}
+    # default role handled by the column default if not provided
+    if user.role is not None:
+        values["role"] = user.role
+    # INSERT ... RETURNING reads back id/role in the same round-trip (no refresh SELECT)
+    new_user = db.execute(
+        insert(User).values(**values).returning(User.id, User.username, User.email, User.role)
+    ).one()
     db.commit()
-    db.refresh(new_user)
+    invalidate_user(new_user.username)
     try:
-        user_registration_log.delay(user_email=new_user.email, user_role=new_user.role)
+        user_registration_log.apply_async(
+            kwargs={"user_email": new_user.email, "user_role": new_user.role},
+            ignore_result=True, expires=30
+        )
     except Exception as e:
-        # Broker might be unavailable; fallback to sync logging
+        # Broker might be unavailable; hand off to the in-process fallback queue
         print(f"[auth] failed to enqueue user_registration_log: {e}")
-        user_registration_log_sync(new_user.email, new_user.role)
-    return new_user
+        enqueue_log_fallback(user_registration_log_sync, user_email=new_user.email, user_role=new_user.role)
+    return UserResponse(**new_user._mapping)
 
 @router.post("/login")
 def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     # OAuth2PasswordRequestForm gives .username and .password from form data
-    db_user = db.query(User).filter_by(username=form_data.username).first()
-    if not db_user or not verify_password(form_data.password, db_user.hashed_password):
+    db_user = get_user_by_username(db, form_data.username)
+    if not db_user:
+        verify_dummy_password(form_data.password)
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    if not verify_password(form_data.password, db_user.hashed_password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
     token, jti, expires = create_access_token(
@@ -49,10 +64,10 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
     )
 
     try:
-        user_login_log.delay(user_email=db_user.email)
+        user_login_log.apply_async(kwargs={"user_email": db_user.email}, ignore_result=True, expires=30)
     except Exception as e:
         print(f"[auth] failed to enqueue user_login_log: {e}")
-        user_login_log_sync(db_user.email)
+        enqueue_log_fallback(user_login_log_sync, user_email=db_user.email)
     return {"access_token": token, "token_type": "bearer", "jti": jti, "expires_at": expires.isoformat()}
 
 @router.post("/logout")
@@ -67,15 +82,19 @@ def logout(token: str = Security(oauth2_scheme), db: Session = Depends(get_db)):
     # find user if possible
     user = None
     if sub:
-        user = db.query(User).filter_by(username=sub).first()
+        user = get_user_by_username(db, sub)
+        invalidate_user(sub)
 
-    # store revoked token
-    revoked = RevokedToken(jti=jti, user_id=getattr(user, 'id', None), expires_at=None)
+    # store revoked token; keep its expiry so expired rows can be swept later
+    exp = payload.get("exp")
+    expires_at = datetime.fromtimestamp(exp, tz=timezone.utc) if exp else None
+    revoked = RevokedToken(jti=jti, user_id=getattr(user, 'id', None), expires_at=expires_at)
     db.add(revoked)
     db.commit()
+    mark_revoked(jti)
     try:
-        user_logout_log.delay(user_email=getattr(user, 'email', None))
+        user_logout_log.apply_async(kwargs={"user_email": getattr(user, 'email', None)}, ignore_result=True, expires=30)
     except Exception as e:
         print(f"[auth] failed to enqueue user_logout_log: {e}")
-        user_logout_log_sync(getattr(user, 'email', None))
+        enqueue_log_fallback(user_logout_log_sync, user_email=getattr(user, 'email', None))
     return {"msg": "logged out"}
@@ -1,4 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 from sqlalchemy.orm.session import Session
 from typing import Optional
 
@@ -8,25 +10,32 @@ from app.db.models import User
 from app.schemas.config_schema import ConfigResponse, ConfigUpdateSchema
 from app.core.security import get_current_user
 from app.tasks.logger import (
-    log_config_update, log_config_retrieval,
-    log_config_update_sync, log_config_retrieval_sync, log_config_delete, log_config_version_compare,
+    log_config_update, log_config_retrieval, log_config_retrieval_batch,
+    log_config_update_sync, log_config_retrieval_sync, log_config_retrieval_batch_sync, log_config_delete, log_config_version_compare,
     log_config_version_compare_sync, log_config_version_rollback, log_config_version_rollback_sync
 )
 
 router = APIRouter(prefix="/config", tags=["Configuration"])
 
 @router.get("/health")
-def health_check():
+def health_check(db: Session = Depends(get_db)):
     """
     Health check endpoint to verify the service is running.
     Example: GET /config/health
     """
-    db = next(get_db())
-    # Simple DB operation to ensure connectivity
-    return {"api_status": "ok", "db_status": "connected" if db else "disconnected"}
+    # Simple DB operation to ensure connectivity; the session is closed by get_db
+    try:
+        db.execute(text("SELECT 1")).scalar()
+    except Exception as e:
+        print(f"[routes_config] health check DB query failed: {e}")
+        return ORJSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"api_status": "ok", "db_status": "disconnected"},
+        )
+    return {"api_status": "ok", "db_status": "connected"}
 
 
-@router.get("/list", dependencies=[Depends(get_current_user)])
+@router.get("/list", response_class=ORJSONResponse, dependencies=[Depends(get_current_user)])
 def list_configs(
         db: Session = Depends(get_db),
         user: User = Depends(get_current_user),
@@ -45,23 +54,28 @@ def list_configs(
 
     configs = repo.list_all_configs_for_user(user_id=target_user_id, current_user=user)
 
-    result = []
-    for c in configs:
-        result.append({
+    result = [
+        {
             "id": c.id,
             "name": c.name,
             "config": c.config,
-            "updated_at": c.updated_at.isoformat() if c.updated_at else None,
+            "updated_at": c.updated_at,
             "user_id": c.user_id,
-        })
-        # Try to enqueue logging; fallback to sync if broker unavailable
-        try:
-            log_config_retrieval.delay(service_name=c.name, user_email=user.email)
-        except Exception as e:
-            print(f"[routes_config] failed to enqueue log_config_retrieval: {e}")
-            log_config_retrieval_sync(c.name, user.email)
-
-    return {"configs": result}
+        }
+        for c in configs
+    ]
+
+    # Enqueue a single logging task for the whole listing; fallback to sync if broker unavailable
+    service_names = [c["name"] for c in result]
+    try:
+        log_config_retrieval_batch.delay(service_names=service_names, user_email=user.email)
+    except Exception as e:
+        print(f"[routes_config] failed to enqueue log_config_retrieval_batch: {e}")
+        log_config_retrieval_batch_sync(service_names, user.email)
+
+    # Return the response directly so orjson encodes the rows (and their datetimes)
+    # without a jsonable_encoder pass over every config
+    return ORJSONResponse({"configs": result})
 
 @router.get("/get", response_model=ConfigResponse, dependencies=[Depends(get_current_user)])
 def get_config(
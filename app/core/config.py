@@ -9,6 +9,10 @@ class Settings(BaseSettings):
     API_KEY: str = "supersecretkey"
     # Default to localhost for local dev; Docker overrides via environment
     REDIS_URL: str = "redis://localhost:6379/0"
+    # bcrypt work factor; 10 keeps a hash around ~50ms on typical hosts (OWASP minimum is 10)
+    BCRYPT_ROUNDS: int = 10
+    # How long a username -> user lookup is served from the in-process cache
+    USER_CACHE_TTL_SECONDS: float = 2.0
 
     model_config = SettingsConfigDict(
         env_file=".env",  # Optional file for environment variables
@@ -0,0 +1,108 @@
+import threading
+import time
+
+import redis
+from sqlalchemy import or_, select, func
+from sqlalchemy.orm.session import Session
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.db.models import RevokedToken
+
+# Redis channel used to broadcast revocations to every API worker
+REVOCATION_CHANNEL = "configsync:revoked_tokens"
+
+# In-process set of revoked JTIs. Membership is authoritative for "revoked";
+# a miss is only authoritative while the pub/sub listener is in sync.
+_REVOKED: set[str] = set()
+_lock = threading.Lock()
+_synced = threading.Event()
+_listener: threading.Thread | None = None
+_redis_client = None
+
+
+def _get_redis():
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(settings.REDIS_URL, socket_connect_timeout=1, socket_timeout=1)
+    return _redis_client
+
+
+def load_revoked(db: Session):
+    """Load all still-valid revoked JTIs from the database into the local set."""
+    rows = db.execute(
+        select(RevokedToken.jti).where(
+            or_(RevokedToken.expires_at.is_(None), RevokedToken.expires_at > func.now())
+        )
+    ).scalars().all()
+    with _lock:
+        _REVOKED.update(rows)
+
+
+def mark_revoked(jti: str):
+    """Record a revocation locally and broadcast it to the other workers."""
+    with _lock:
+        _REVOKED.add(jti)
+    try:
+        _get_redis().publish(REVOCATION_CHANNEL, jti)
+    except Exception as e:
+        # Other workers fall back to the DB check until their listener resyncs
+        print(f"[revocation] failed to publish revoked jti: {e}")
+
+
+def is_revoked(jti: str, db: Session) -> bool:
+    """Check whether a token has been revoked, hitting the DB only when the cache may be stale."""
+    if jti in _REVOKED:
+        return True
+    if _synced.is_set():
+        return False
+    revoked = db.query(RevokedToken).filter_by(jti=jti).first()
+    if revoked:
+        with _lock:
+            _REVOKED.add(jti)
+        return True
+    return False
+
+
+def _listen():
+    backoff = 1
+    while True:
+        pubsub = None
+        try:
+            pubsub = redis.Redis.from_url(settings.REDIS_URL).pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(REVOCATION_CHANNEL)
+            # Subscribe before loading the snapshot so no revocation slips in between
+            db = SessionLocal()
+            try:
+                load_revoked(db)
+            finally:
+                db.close()
+            _synced.set()
+            backoff = 1
+            for message in pubsub.listen():
+                if message.get("type") == "message":
+                    jti = message["data"]
+                    if isinstance(jti, bytes):
+                        jti = jti.decode()
+                    with _lock:
+                        _REVOKED.add(jti)
+        except Exception as e:
+            print(f"[revocation] listener disconnected: {e}")
+        finally:
+            _synced.clear()
+            if pubsub is not None:
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+        time.sleep(backoff)
+        backoff = min(backoff * 2, 30)
+
+
+def start_revocation_listener():
+    """Start the background thread that keeps the local revocation set in sync."""
+    global _listener
+    if _listener is not None and _listener.is_alive():
+        return
+    _listener = threading.Thread(target=_listen, name="revocation-listener", daemon=True)
+    _listener.start()
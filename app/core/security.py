@@ -9,12 +9,15 @@ from datetime import timedelta, datetime
 
 import jwt
 import uuid
+from functools import lru_cache
 
+from app.core.config import settings
 from app.db.database import get_db
-from app.db.models import User, RevokedToken
+from app.core.revocation import is_revoked
+from app.core.user_cache import get_user_by_username
 
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
@@ -30,6 +33,15 @@ def get_password_hash(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    return pwd_context.hash("configsync-dummy-password")
+
+def verify_dummy_password(plain_password: str) -> bool:
+    """Burn the same hashing time as a real check, so unknown usernames aren't revealed by response timing."""
+    pwd_context.verify(plain_password, _dummy_password_hash())
+    return False
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
     to_encode = data.copy()
     expire = datetime.now() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
@@ -52,13 +64,11 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     if username is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
-    # Check token revocation table
-    if jti:
-        revoked = db.query(RevokedToken).filter_by(jti=jti).first()
-        if revoked:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked")
+    # Check token revocation (in-process cache, falling back to the revoked_tokens table)
+    if jti and is_revoked(jti, db):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked")
 
-    user = db.query(User).filter_by(username=username).first()
+    user = get_user_by_username(db, username)
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
 
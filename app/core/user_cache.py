@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm.session import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.db.models import User
+
+
+@dataclass(frozen=True)
+class CachedUser:
+    """
+    Snapshot of the user columns the auth path needs.
+    Exposes the same attributes routes read from the `User` model.
+    """
+    id: int
+    username: str
+    email: str
+    role: str
+    hashed_password: str
+
+
+_USER_CACHE = TTLCache(maxsize=4096, ttl=settings.USER_CACHE_TTL_SECONDS)
+
+
+def get_user_by_username(db: Session, username: str) -> Optional[CachedUser]:
+    """Resolve a username to a CachedUser, serving repeat lookups from the TTL cache."""
+    cached = _USER_CACHE.get(username)
+    if cached is not None:
+        return cached
+
+    row = db.execute(
+        select(User.id, User.username, User.email, User.role, User.hashed_password)
+        .where(User.username == username)
+    ).first()
+    if row is None:
+        return None
+
+    user = CachedUser(**row._mapping)
+    _USER_CACHE.set(username, user)
+    return user
+
+
+def invalidate_user(username: str):
+    _USER_CACHE.pop(username)
+
+
+def clear_user_cache():
+    _USER_CACHE.clear()
@@ -1,4 +1,5 @@
 from fastapi import HTTPException
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import Optional
 from deepdiff import DeepDiff
@@ -148,39 +149,48 @@ class ConfigRepository:
 
         Admins may omit user_id to list across all users.
         """
-        db = self.db
         print("Attempting to list versions with user_id:", user_id)
-        query = db.query(ConfigVersion)
+        stmt = select(ConfigVersion).where(ConfigVersion.service_name == service_name)
         if self._is_admin(current_user):
             if user_id is not None:
-                query = query.filter_by(service_name=service_name, user_id=user_id)
-            else:
-                query = query.filter_by(service_name=service_name)
+                stmt = stmt.where(ConfigVersion.user_id == user_id)
         else:
             if user_id is None:
                 raise ValueError("user_id is required for non-admin operations")
-            query = query.filter_by(service_name=service_name, user_id=user_id)
+            stmt = stmt.where(ConfigVersion.user_id == user_id)
 
-        print("Constructed query for listing versions:", query)
-        return query.order_by(ConfigVersion.version.desc()).all()
+        stmt = stmt.order_by(ConfigVersion.version.desc())
+        print("Constructed query for listing versions:", stmt)
+        # Single round-trip: ConfigVersion has no relationships, so nothing is lazy-loaded afterwards
+        return self.db.execute(stmt).scalars().all()
 
     def list_all_configs_for_user(
             self,
             user_id: Optional[int] = None,
             current_user: Optional[User] = None
     ):
-        """Helper to list current service configs. If admin and user_id is None, returns all configs."""
-        query = self.db.query(ServiceConfig)
+        """Helper to list current service configs. If admin and user_id is None, returns all configs.
+
+        Returns lightweight rows (id, name, config, updated_at, user_id) rather than ORM objects,
+        since callers only read these columns to build the listing response.
+        """
+        stmt = select(
+            ServiceConfig.id,
+            ServiceConfig.name,
+            ServiceConfig.config,
+            ServiceConfig.updated_at,
+            ServiceConfig.user_id,
+        )
         if self._is_admin(current_user):
             if user_id is not None:
-                query = query.filter_by(user_id=user_id)
+                stmt = stmt.where(ServiceConfig.user_id == user_id)
             # else admin: no filter -> return everything
         else:
             if user_id is None:
                 raise ValueError("user_id is required for non-admin operations")
-            query = query.filter_by(user_id=user_id)
+            stmt = stmt.where(ServiceConfig.user_id == user_id)
 
-        return query.all()
+        return self.db.execute(stmt).all()
 
     def diff_versions(
             self,
@@ -22,7 +22,7 @@ class ServiceConfig(Base):
         nullable=False
     )
     # Associate config with a user (owner)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
 
 class ConfigVersion(Base):
     __tablename__ = "config_versions"
@@ -33,7 +33,7 @@ class ConfigVersion(Base):
     config = Column(JSON)
     created_at = Column(DateTime, default=datetime.now)
     # Associate version entry with a user (owner)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
 
     __table_args__ = (
         Index('ix_version_service_user', 'service_name', 'user_id'),
@@ -52,7 +52,7 @@ class User(Base):
 class RevokedToken(Base):
     __tablename__ = "revoked_tokens"
 
-    jti = Column(String, primary_key=True, index=True)
+    jti = Column(String, primary_key=True)
     revoked_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    expires_at = Column(DateTime(timezone=True), nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 import fastapi_cdn_host
 import os
 
@@ -7,11 +8,14 @@ from app.db.database import engine
 from app.api.routes_config import router as config_router
 from app.api.auth import router as auth
 from app.core.config import settings
+from app.core.revocation import start_revocation_listener
 
 app = FastAPI(
     title="ConfigSync",
     description="Centralized configuration management service",
-    version="1.0.0"
+    version="1.0.0",
+    # Serialize responses with orjson instead of the stdlib json encoder
+    default_response_class=ORJSONResponse
 )
 
 # Patch to serve swagger UI resources locally
@@ -22,6 +26,8 @@ def on_startup():
     # Skip database creation during tests - tests manage their own DB
     if os.getenv("TESTING") != "true":
         models.Base.metadata.create_all(bind=engine)
+        # Warm the revoked-token cache and keep it in sync across workers
+        start_revocation_listener()
 
 @app.get("/")
 def read_root():
@@ -11,6 +11,7 @@ celery_app = Celery(
 celery_app.conf.task_routes = {
     "app.tasks.logger.log_config_update": {"queue": "default"},
     "app.tasks.logger.log_config_retrieval": {"queue": "default"},
+    "app.tasks.logger.log_config_retrieval_batch": {"queue": "default"},
     "app.tasks.logger.log_config_delete": {"queue": "default"},
     "app.tasks.logger.log_config_version_compare": {"queue": "default"},
     "app.tasks.logger.user_login_log": {"queue": "default"},
@@ -19,4 +20,14 @@ celery_app.conf.task_routes = {
 }
 
 # Ensure the worker consumes the same default queue used by task routes
-celery_app.conf.task_default_queue = "default"
\ No newline at end of file
+celery_app.conf.task_default_queue = "default"
+
+# Fail fast when the broker is unreachable so API callers can fall back quickly
+# instead of stalling the request on connection retries.
+celery_app.conf.broker_connection_timeout = 0.2
+celery_app.conf.task_publish_retry_policy = {
+    "max_retries": 1,
+    "interval_start": 0,
+    "interval_step": 0.1,
+    "interval_max": 0.1,
+}
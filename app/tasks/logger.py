@@ -1,6 +1,8 @@
 from datetime import datetime
 from app.tasks.celery_app import celery_app
 import os
+import queue
+import threading
 
 # Resolve log file path relative to the repository, so it works in Docker and locally
 LOG_FILE_PATH = os.path.normpath(
@@ -27,6 +29,36 @@ def _write_log_line(line: str):
         # Surface any file write errors to worker logs
         print(f"[logger] failed to write log line: {e}")
 
+# ---- Fallback queue (used by the API when the broker is unavailable) ----
+# Bounded so a broker outage cannot grow memory without limit; a daemon thread
+# drains it into the sync helpers so log I/O stays off the request thread.
+_fallback_queue = queue.Queue(maxsize=10000)
+_fallback_worker = None
+_fallback_worker_lock = threading.Lock()
+
+def _drain_fallback_queue():
+    while True:
+        func, kwargs = _fallback_queue.get()
+        try:
+            func(**kwargs)
+        except Exception as e:
+            print(f"[logger] fallback log call failed: {e}")
+        finally:
+            _fallback_queue.task_done()
+
+def enqueue_log_fallback(func, **kwargs):
+    """Queue a sync log helper to run on the background fallback thread; drops the event if the queue is full."""
+    global _fallback_worker
+    if _fallback_worker is None:
+        with _fallback_worker_lock:
+            if _fallback_worker is None:
+                _fallback_worker = threading.Thread(target=_drain_fallback_queue, name="log-fallback", daemon=True)
+                _fallback_worker.start()
+    try:
+        _fallback_queue.put_nowait((func, kwargs))
+    except queue.Full:
+        print(f"[logger] fallback queue full, dropping {func.__name__}")
+
 # ---- Synchronous helpers (callable from API as fallback) ----
 def log_config_update_sync(service_name: str, user_email: str):
     print(f"[logger.sync.log_config_update] start: service={service_name}, user={user_email}")
@@ -44,6 +76,18 @@ def log_config_retrieval_sync(service_name: str, user_email: str):
     print(f"[logger.sync.log_config_retrieval] done: service={service_name}, user={user_email}")
 
 
+def log_config_retrieval_batch_sync(service_names: list[str], user_email: str):
+    print(f"[logger.sync.log_config_retrieval_batch] start: services={len(service_names)}, user={user_email}")
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    log_lines = "".join(
+        f"[{timestamp}] User '{user_email}' retrieved config for service '{service_name}'\n"
+        for service_name in service_names
+    )
+    if log_lines:
+        _write_log_line(log_lines)
+    print(f"[logger.sync.log_config_retrieval_batch] done: services={len(service_names)}, user={user_email}")
+
+
 def log_config_delete_sync(service_name: str, user_email: str):
     print(f"[logger.sync.log_config_delete] start: service={service_name}, user={user_email}")
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -106,6 +150,10 @@ def log_config_update(self, service_name: str, user_email: str):
 def log_config_retrieval(self, service_name: str, user_email: str):
     log_config_retrieval_sync(service_name, user_email)
 
+@celery_app.task(bind=True)
+def log_config_retrieval_batch(self, service_names: list[str], user_email: str):
+    log_config_retrieval_batch_sync(service_names, user_email)
+
 @celery_app.task(bind=True)
 def log_config_delete(self, service_name: str, user_email: str):
     log_config_delete_sync(service_name, user_email)
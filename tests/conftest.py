@@ -16,6 +16,7 @@ from app.main import app
 from app.db.database import Base, get_db
 from app.core.security import get_password_hash, create_access_token
 from app.db.models import User
+from app.core.user_cache import clear_user_cache
 from datetime import timedelta
 
 # Use in-memory SQLite database for tests (fast and isolated)
@@ -38,6 +39,8 @@ def setup_test_db():
     """
     # Create all tables
     Base.metadata.create_all(bind=engine)
+    # Cached user lookups must not leak between tests (ids are reused)
+    clear_user_cache()
     yield
     # Drop all tables after test
     Base.metadata.drop_all(bind=engine)
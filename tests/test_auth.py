@@ -145,6 +145,7 @@ class TestLogout:
         revoked = db_session.query(RevokedToken).filter_by(jti=jti).first()
         assert revoked is not None
         assert revoked.user_id == normal_user.id
+        assert revoked.expires_at is not None
 
     def test_cannot_use_revoked_token(self, client, auth_headers_normal):
         """Test that a revoked token cannot be used for authenticated requests."""
@@ -159,4 +160,17 @@ class TestLogout:
     def test_logout_without_token(self, client):
         """Test logout fails without authentication."""
         response = client.post("/auth/logout")
-        assert response.status_code == 401
\ No newline at end of file
+        assert response.status_code == 401
+    def test_token_revoked_elsewhere_is_rejected(self, client, db_session, normal_user, normal_user_token,
+                                                 auth_headers_normal):
+        """Test that a revocation not yet in the in-process cache is still enforced via the DB."""
+        from app.core.security import decode_access_token
+        jti = decode_access_token(normal_user_token)["jti"]
+
+        # Simulate another worker revoking the token
+        db_session.add(RevokedToken(jti=jti, user_id=normal_user.id))
+        db_session.commit()
+
+        response = client.get("/config/list", headers=auth_headers_normal)
+        assert response.status_code == 401
+        assert "Token revoked" in response.json()["detail"]
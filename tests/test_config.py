@@ -193,6 +193,8 @@ class TestConfigRetrieval:
         names = [c["name"] for c in data["configs"]]
         assert "service1" in names
         assert "service2" in names
+        # Timestamps are serialized as ISO-8601 strings
+        assert all(isinstance(c["updated_at"], str) for c in data["configs"])
 
     def test_list_only_shows_own_configs(self, client, normal_user, admin_user, auth_headers_normal, db_session):
         """Test that normal users only see their own configs."""